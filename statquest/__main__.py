@@ -36,6 +36,13 @@ Copyright (c) 2023 Sławomir Marczyński
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import multiprocessing
+
 from statquest_main import main
 
-main()
+# The guard is needed because a process started by multiprocessing imports
+# this module again, and it must not start the GUI once more.
+#
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main()
@@ -83,9 +83,28 @@ class ScrollableFrame(ttk.Frame):
         # the scroll range. for he is set at the canvas level and needs to
         # be refreshed in this situation.
         #
+        # The frame is the only item on the canvas, placed at (0, 0), thus
+        # the scroll range is just the frame size, without asking the canvas
+        # for the bounding box of all items.
+        #
+        # A burst of <Configure> events, e.g. while the window is resized,
+        # is coalesced: the size given by the last event is kept and the
+        # scroll range is set once, when Tk is idle.
+        #
         self._scrollable_frame = ttk.Frame(canvas)
-        self._scrollable_frame.bind('<Configure>',
-            lambda event: canvas.configure(scrollregion=canvas.bbox('all')))
+        self._scroll_region_pending = None
+
+        def update_scroll_region():
+            width, height = self._scroll_region_pending
+            self._scroll_region_pending = None
+            canvas.configure(scrollregion=(0, 0, width, height))
+
+        def schedule_scroll_region(event):
+            if self._scroll_region_pending is None:
+                canvas.after_idle(update_scroll_region)
+            self._scroll_region_pending = (event.width, event.height)
+
+        self._scrollable_frame.bind('<Configure>', schedule_scroll_region)
 
         # Adding content - another widget - to the canvas is done method
         # create_window. The name may be associated with some factory or
@@ -105,12 +124,23 @@ class ScrollableFrame(ttk.Frame):
         # geometry manager would not be able to act accordingly with our
         # expectations.
         #
-        def update_scrollable_frame_width(event):
-            if self._scrollable_frame.winfo_reqwidth() != canvas.winfo_width():
-                canvas.itemconfigure(scrollable_frame_canvas_id,
-                    width=canvas.winfo_width())
+        # The same as for the scroll range, the width is updated once for
+        # a burst of <Configure> events.
+        #
+        self._frame_width_pending = None
+
+        def update_scrollable_frame_width():
+            width = self._frame_width_pending
+            self._frame_width_pending = None
+            if self._scrollable_frame.winfo_reqwidth() != width:
+                canvas.itemconfigure(scrollable_frame_canvas_id, width=width)
+
+        def schedule_scrollable_frame_width(event):
+            if self._frame_width_pending is None:
+                canvas.after_idle(update_scrollable_frame_width)
+            self._frame_width_pending = event.width
 
-        canvas.bind('<Configure>', update_scrollable_frame_width)
+        canvas.bind('<Configure>', schedule_scrollable_frame_width)
 
         # We could do it a bit earlier, but we do it last: connect the
         # canvas scroll with what is set by the beam scrolling (i.e. via
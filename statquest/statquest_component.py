@@ -46,6 +46,11 @@ class Component:
     The base class for creating program components.
     """
 
+    # Subclasses may (and usually do) have their own attributes in __dict__,
+    # but the attributes used by every component are kept in slots.
+    #
+    __slots__ = ('_parent_component', '_parent_frame', '_observers', '_frame')
+
     def __init__(self, parent_component, parent_frame=None, border=True):
         """
         A program component is an object that can have a window/widget
@@ -70,8 +75,8 @@ class Component:
             self._frame = ttk.Frame(parent_frame)
             if border:
                 self._frame.configure(relief='solid', borderwidth=5)
-            self._frame.pack(side='top', fill='x', expand=True)
-            self._frame.pack_configure(padx=10, pady=10)
+            self._frame.pack(side='top', fill='x', expand=True,
+                             padx=10, pady=10)
 
     def update(self, observed):
         """The default call handling as an observer/listener."""
@@ -97,6 +102,5 @@ class Component:
         """
         Observer pattern - broadcast to recipients of subscribed information.
         """
-        if self._observers:
-            for observer in self._observers:
-                observer.update(self)
+        for observer in self._observers:
+            observer.update(self)
@@ -41,6 +41,7 @@ Copyright (c) 2023 Sławomir Marczyński
 import os
 import re
 import tkinter as tk
+from functools import partial
 from tkinter import filedialog, ttk
 
 from statquest_component import Component
@@ -48,6 +49,34 @@ from statquest_locale import setup_locale_translation_gettext
 
 _ = setup_locale_translation_gettext()
 
+# The suffix of the main output file name, compiled once because the pattern
+# is used on each change of the name (i.e. on each key pressed in the entry).
+#
+_LINKS_SUFFIX = re.compile(r'_links$')
+
+# File types shown in file dialogs, for the input file and for output files
+# (the latter by the extension of the file).
+#
+_OPEN_FILETYPES = (('CSV', '*.csv'), ('Excel', '*.xlsx'))
+_SAVE_FILETYPES = {
+    '.txt': (('text', '*.txt'),),
+    '.csv': (('CSV', '*.csv'),),
+    '.xlsx': (('Excel', '*.xlsx'),),
+    '.html': (('HTML', '*.html'),), }
+
+# Names of output files derived from the name of the main output file:
+# attributes of FilesNames and suffixes appended to the common base.
+#
+_DERIVED_SUFFIXES = (
+    ('profi_htm', '_profile.html'),
+    ('tests_csv', '_tests.csv'))
+
+# Observers are notified when names have not been changed for
+# _DEBOUNCE_DELAY milliseconds, thus once for a path typed in the entry,
+# not once for each key pressed.
+#
+_DEBOUNCE_DELAY = 250
+
 
 class FilesNames(Component):
     """
@@ -71,6 +100,39 @@ class FilesNames(Component):
         self.profi_htm = tk.StringVar()
         self.tests_csv = tk.StringVar()
 
+        # Changing one file name changes other file names. Observers are
+        # notified once, after all names have been changed, not after each
+        # StringVar.set() call.
+        #
+        self._suspend_callbacks = False
+        self._pending_callback = None
+
+        # File dialogs are opened in the directory used last time.
+        #
+        self._last_directory = None
+
+        def callback_once(*args):
+            """
+            Notify observers, unless names are being changed in a batch;
+            the notification is postponed while names are being changed.
+
+            Args:
+                *args: needed for tkinker callback
+            """
+            if self._suspend_callbacks:
+                return
+            if self._pending_callback is not None:
+                self._frame.after_cancel(self._pending_callback)
+            self._pending_callback = self._frame.after(
+                _DEBOUNCE_DELAY, callback_pending)
+
+        def callback_pending():
+            """
+            Notify observers when names have not been changed for a while.
+            """
+            self._pending_callback = None
+            self.callback()
+
         def callback_input(*args):
             """
             Reaction to changing the name of the input file - the name of
@@ -79,10 +141,14 @@ class FilesNames(Component):
             Args:
                 *args: needed for tkinker callback
             """
-            head, tail = os.path.split(self.input_csv.get())
-            name, extension = os.path.splitext(tail)
-            self.tests_dot.set(os.path.join(head, name + '_links.txt'))
-            self.callback(*args)
+            base, extension = os.path.splitext(self.input_csv.get())
+            suspended = self._suspend_callbacks
+            self._suspend_callbacks = True
+            try:
+                self.tests_dot.set(base + '_links.txt')
+            finally:
+                self._suspend_callbacks = suspended
+            callback_once(*args)
 
         def callback_output(*args):
             """
@@ -92,21 +158,26 @@ class FilesNames(Component):
             Args:
                 *args: needed for tkinker callback
             """
-            head, tail = os.path.split(self.tests_dot.get())
-            name, extension = os.path.splitext(tail)
-            name = re.sub(r'_links$', '', name)
-            self.profi_htm.set(os.path.join(head, name + '_profile' + '.html'))
-            self.tests_csv.set(os.path.join(head, name + '_tests' + '.csv'))
-            self.callback(*args)
+            base, extension = os.path.splitext(self.tests_dot.get())
+            base = _LINKS_SUFFIX.sub('', base)
+            suspended = self._suspend_callbacks
+            self._suspend_callbacks = True
+            try:
+                for attribute, suffix in _DERIVED_SUFFIXES:
+                    getattr(self, attribute).set(base + suffix)
+            finally:
+                self._suspend_callbacks = suspended
+            callback_once(*args)
 
         def pick_open():
             """
             Reaction to pressing the input file selection button.
             """
             full_name = filedialog.askopenfilename(
-                filetypes=(('CSV', '*.csv'), ("Excel", "*.xlsx")))
+                filetypes=_OPEN_FILETYPES, initialdir=self._last_directory)
             if full_name:
                 full_name = os.path.normpath(full_name)
+                self._last_directory = os.path.dirname(full_name)
                 self.input_csv.set(full_name)
 
         def pick_save(variable, req_ext):
@@ -117,86 +188,63 @@ class FilesNames(Component):
                 variable (tkinter.StringVar): file name as StringVar
                 req_ext: an extension of the required file name.
             """
-            known_types = {
-                '.txt': 'text',
-                '.csv': 'CSV',
-                '.xlmx': 'Excel',
-                '.html': 'HTML', }
-            filetypes = (known_types[req_ext], '*' + req_ext)
-            name = filedialog.asksaveasfilename(filetypes=(filetypes,))
+            filetypes = _SAVE_FILETYPES[req_ext]
+            name = filedialog.asksaveasfilename(
+                filetypes=filetypes, initialdir=self._last_directory)
             if name:
                 name = os.path.normpath(name)
+                self._last_directory = os.path.dirname(name)
                 variable.set(name)
 
         # Add observers/listeners to handle changes in entry fields models.
         #
         self.input_csv.trace_add('write', callback_input)
         self.tests_dot.trace_add('write', callback_output)
-        self.profi_htm.trace_add('write', self.callback)
-        self.tests_csv.trace_add('write', self.callback)
+        self.profi_htm.trace_add('write', callback_once)
+        self.tests_csv.trace_add('write', callback_once)
 
         # An abbreviation of self._frame.
         #
         frame = self._frame
 
-        # Create widgets: labels.
+        # Create widgets: labels of the groups of files.
         #
         label_input = ttk.Label(frame, text=_('Input data files'))
         label_output = ttk.Label(frame, text=_('Output data files'))
-        label_input_csv = ttk.Label(frame, text=_('Input worksheet:'))
-        label_tests_dot = ttk.Label(frame, text=_('Dependency graph:'))
-        label_profi_htm = ttk.Label(frame, text=_('Profile:'))
-        label_tests_csv = ttk.Label(frame, text=_('Detail results:'))
-
-        # Create widgets: entry fields with models (i.e. traced variables).
-        #
-        entry_input_csv = ttk.Entry(frame, textvariable=self.input_csv)
-        entry_tests_dot = ttk.Entry(frame, textvariable=self.tests_dot)
-        entry_profi_htm = ttk.Entry(frame, textvariable=self.profi_htm)
-        entry_tests_csv = ttk.Entry(frame, textvariable=self.tests_csv)
+        label_input.grid(row=0, column=0, sticky='w', padx=5, pady=5)
+        label_output.grid(row=2, column=0, sticky='w', padx=5, pady=5)
 
-        # Create widgets: buttons.
+        # Create widgets: each file has its row with a label, an entry field
+        # with a model (i.e. traced variable) and a button. All elements are
+        # placed by the grid manager - entry fields are resizable - may
+        # expand horizontally.
         #
-        button_input_csv = ttk.Button(
-            frame,
-            text=_('change all files'),
-            command=lambda: pick_open())
-        button_tests_dot = ttk.Button(
-            frame,
-            text=_('change output files'),
-            command=lambda: pick_save(self.tests_dot, ".txt"))
-        button_profi_htm = ttk.Button(
-            frame,
-            text=_('change'),
-            command=lambda: pick_save(self.profi_htm, ".csv"))
-        button_tests_csv = ttk.Button(
-            frame,
-            text=_('change'),
-            command=lambda: pick_save(self.tests_csv, ".csv"))
-
-        # TL;DR - all elements are placed by the grid manager
-        # - entry fields are resizable - may expand horizontally.
-
-        label_input.grid(row=0, column=0, sticky='w')
-        label_output.grid(row=2, column=0, sticky='w')
-        label_input_csv.grid(row=1, column=1, sticky='e')
-        label_tests_dot.grid(row=3, column=1, sticky='e')
-        label_profi_htm.grid(row=4, column=1, sticky='e')
-        label_tests_csv.grid(row=5, column=1, sticky='e')
-
-        entry_input_csv.grid(row=1, column=2, sticky='we')
-        entry_tests_dot.grid(row=3, column=2, sticky='we')
-        entry_profi_htm.grid(row=4, column=2, sticky='we')
-        entry_tests_csv.grid(row=5, column=2, sticky='we')
-
-        button_input_csv.grid(row=1, column=3, sticky='ew')
-        button_tests_dot.grid(row=3, column=3, sticky='ew')
-        button_profi_htm.grid(row=4, column=3, sticky='ew')
-        button_tests_csv.grid(row=5, column=3, sticky='ew')
+        rows = (
+            (1, _('Input worksheet:'), self.input_csv,
+             _('change all files'), pick_open),
+            (3, _('Dependency graph:'), self.tests_dot,
+             _('change output files'),
+             partial(pick_save, self.tests_dot, ".txt")),
+            (4, _('Profile:'), self.profi_htm,
+             _('change'), partial(pick_save, self.profi_htm, ".html")),
+            (5, _('Detail results:'), self.tests_csv,
+             _('change'), partial(pick_save, self.tests_csv, ".csv")))
+        for row, label_text, variable, button_text, command in rows:
+            label = ttk.Label(frame, text=label_text)
+            entry = ttk.Entry(frame, textvariable=variable)
+            button = ttk.Button(frame, text=button_text, command=command)
+            label.grid(row=row, column=1, sticky='e', padx=5, pady=5)
+            entry.grid(row=row, column=2, sticky='we', padx=5, pady=5)
+            button.grid(row=row, column=3, sticky='ew', padx=5, pady=5)
 
         frame.columnconfigure(2, weight=1)
 
-        # Set uniform/standard padding for all widgets in the frame.
-        #
-        for widget in frame.winfo_children():
-            widget.grid_configure(padx=5, pady=5)
+    def flush_callback(self):
+        """
+        Notify observers at once if a notification is postponed, thus
+        they know the names shown in entries before these are used.
+        """
+        if self._pending_callback is not None:
+            self._frame.after_cancel(self._pending_callback)
+            self._pending_callback = None
+            self.callback()
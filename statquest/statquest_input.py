@@ -40,8 +40,10 @@ Copyright (c) 2023 Sławomir Marczyński.
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import stat
 import tkinter as tk
-from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox, ttk
 
 import pandas as pd
 
@@ -52,6 +54,55 @@ from statquest_observable import Observable
 
 _ = setup_locale_translation_gettext()
 
+# Text columns with less distinct values than this fraction of rows are
+# stored as pandas categorical data.
+#
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Input files are parsed by this (one) background thread; the result is
+# polled every POLL_INTERVAL milliseconds from the tkinter event loop.
+#
+PARSING_POOL = ThreadPoolExecutor(max_workers=1)
+POLL_INTERVAL = 50
+
+# At most PARSED_CACHE_SIZE parsed data frames are memoized, the least
+# recently used are forgotten first. Frames other than the most recent one
+# are kept only while all together use no more than PARSED_CACHE_MEMORY
+# bytes. By default only the current data frame is kept, which is in the
+# memory anyway, thus the memo does not add to the memory used.
+#
+PARSED_CACHE_SIZE = 1
+PARSED_CACHE_MEMORY = 256 * 1024 * 1024
+
+
+def compact_data_frame(data_frame):
+    """
+    Store columns of a data frame in more compact types.
+
+    Text columns with few distinct values are converted to categorical
+    type, integer columns are downcast to the smallest integer type.
+    Float-point columns are not changed, thus results of statistical
+    tests are the same. The returned data frame is consolidated, i.e.
+    columns of the same type are stored together.
+
+    Args:
+        data_frame (pandas.DataFrame): data, as read from a file.
+
+    Returns:
+        pandas.DataFrame: the data frame with changed columns.
+    """
+    length = len(data_frame)
+    for name in data_frame.select_dtypes(include=['object', 'string']):
+        column = data_frame[name]
+        if column.nunique() < CATEGORY_MAX_UNIQUE_RATIO * length:
+            data_frame[name] = column.astype('category')
+    for name in data_frame.select_dtypes(include='integer'):
+        data_frame[name] = pd.to_numeric(data_frame[name], downcast='integer')
+    # Replacing columns fragments the data frame; it is consolidated only
+    # once here, not each time selected columns are used.
+    #
+    return data_frame.copy()
+
 
 class Input(Component):
 
@@ -62,17 +113,26 @@ class Input(Component):
         self._data_frame = self._empty_data_frame
         self._file_name = None
         self._code = None
+        self._parsed_data_frames = {}
+        self._future = None
+        self._poll = None
+        self._observables = {}
+        self.relations_cache = {}
         self.is_csv_file = False
         self.is_excel_file = False
-        self._name_variable_list = []
-        self._marked_for_destroy = []
+        # Names of shown columns and variables of their checkboxes are
+        # kept in two parallel lists.
+        #
+        self._names = []
+        self._variables = []
+        self._rows = []
 
         def select_all(*args):
-            for variable in self._name_variable_list:
+            for variable in self._variables:
                 variable.set(True)
 
         def select_none(*args):
-            for variable in self._name_variable_list:
+            for variable in self._variables:
                 variable.set(False)
 
         label = ttk.Label(
@@ -98,63 +158,175 @@ class Input(Component):
             code = self._parent_component.parameters.locale_code.get()
             if file_name != self._file_name or code != self._code:
                 self._data_frame = self._empty_data_frame
+                self._future = None
+                self._observables = {}
+                self.relations_cache = {}
                 self._file_name = file_name
                 self._code = code
                 self.is_csv_file = False
                 self.is_excel_file = False
-                for widget in self._marked_for_destroy:
-                    widget.destroy()
-                self._marked_for_destroy.clear()
-                for name, variable in self._name_variable_list:
-                    del variable
-                self._name_variable_list.clear()
-                if self._file_name and os.path.exists(self._file_name):
+                # Widgets are only hidden, they are reused by _show().
+                #
+                for variable, *widgets in self._rows:
+                    for widget in widgets:
+                        widget.grid_remove()
+                self._names.clear()
+                self._variables.clear()
+                # One stat call both checks that the file exists and gives
+                # the modification time needed by _parse(). A not finished
+                # path, e.g. a directory while the name is typed, is not
+                # a regular file and is not given to a reader at all.
+                #
+                mtime = None
+                if self._file_name:
+                    try:
+                        status = os.stat(self._file_name)
+                        if stat.S_ISREG(status.st_mode):
+                            mtime = status.st_mtime
+                    except OSError:
+                        pass
+                if mtime is not None:
                     __, extension = os.path.splitext(self._file_name)
                     if extension.lower() == '.xlsx':
                         fmt = statquest_locale.setup_locale_excel_format(code)
-                        df = pd.read_excel(self._file_name, **fmt)
-                        self._data_frame = df
+                        self._parse(pd.read_excel, fmt, mtime)
                         self.is_excel_file = True
                     else:
+                        # The C parser reads a memory-mapped file directly,
+                        # without copying it through a buffered reader.
+                        #
                         fmt = statquest_locale.setup_locale_csv_format(code)
-                        df = pd.read_csv(self._file_name, **fmt)
-                        self._data_frame = df
+                        fmt['memory_map'] = True
+                        self._parse(pd.read_csv, fmt, mtime)
                         self.is_csv_file = True
-                    i = 1
-                    for name in self._data_frame:
-                        i += 1
-                        variable = tk.BooleanVar()
-                        variable.set(True)
-                        checkbox = ttk.Checkbutton(
-                            self._frame,
-                            text=name,
-                            variable=variable,
-                            onvalue=True,
-                            offvalue=False)
-                        checkbox.grid(row=i, column=1, sticky='we')
-                        self._name_variable_list.append((name, variable))
-                        self._marked_for_destroy.append(checkbox)
-
-                        try:
-                            series = self._data_frame[name]
-                            obs = Observable(series)
-                            tn = _('nominal') if obs.IS_NOMINAL else '--'
-                            to = _('ordinal') if obs.IS_ORDINAL else '--'
-                            tc = _('continuous') if obs.IS_CONTINUOUS else '--'
-                            ln = ttk.Label(self._frame, text=tn, width=10)
-                            lo = ttk.Label(self._frame, text=to, width=10)
-                            lc = ttk.Label(self._frame, text=tc, width=10)
-                            ln.grid(row=i, column=2, sticky='w', padx=10)
-                            lo.grid(row=i, column=3, sticky='w', padx=10)
-                            lc.grid(row=i, column=4, sticky='w', padx=10)
-                            self._marked_for_destroy.append(ln)
-                            self._marked_for_destroy.append(lo)
-                            self._marked_for_destroy.append(lc)
-                        except:
-                            pass
         except:
             pass
 
+    def _parse(self, reader, fmt, mtime):
+        # Parsing is the expensive step, therefore parsed data frames are
+        # memoized. The key includes the modification time of the file,
+        # thus a changed file is parsed again, and the reader settings,
+        # because the locale changes the separator, decimal point and
+        # encoding. If PARSED_CACHE_SIZE is more than one, then switching
+        # back to a recently used file, or locale, does not parse the file
+        # again. Entries for older versions of the file are dropped, the dict
+        # is ordered from the least recently used. Values are pairs of a data
+        # frame and its size in bytes.
+        #
+        file_name = self._file_name
+        key = (file_name, mtime, tuple(sorted(fmt.items())))
+        entry = self._parsed_data_frames.pop(key, None)
+        if entry is not None:
+            self._parsed_data_frames[key] = entry
+            data_frame, __ = entry
+            self._future = None
+            self._show(data_frame)
+            return
+        self._parsed_data_frames = {
+            k: v for k, v in self._parsed_data_frames.items()
+            if k[0] != file_name or k[1] == mtime}
+        # There is a place made for the data frame being parsed, thus
+        # no more than PARSED_CACHE_SIZE frames are in memory while it is.
+        #
+        self._forget_parsed(PARSED_CACHE_SIZE - 1)
+
+        # A file is parsed by a background thread, and the event loop polls
+        # for the result, thus the GUI is not frozen while a large file is
+        # read. The result is ignored if meanwhile another file (or the same
+        # file with other settings) has been requested. The poll function
+        # is kept, thus wait_for_data_frame() can finish it without delay.
+        #
+        def parse():
+            data_frame = compact_data_frame(reader(file_name, **fmt))
+            return data_frame, data_frame.memory_usage(deep=True).sum()
+
+        future = PARSING_POOL.submit(parse)
+        self._future = future
+
+        def poll(wait=False):
+            if future is not self._future:
+                return False
+            if not wait and not future.done():
+                self._frame.after(POLL_INTERVAL, poll)
+                return False
+            self._future = None
+            try:
+                data_frame, size = future.result()
+            except Exception as ex:
+                # The file name is forgotten, thus the next update() reads
+                # the file again, e.g. when the user has corrected it.
+                #
+                self._file_name = None
+                messagebox.showwarning(
+                    title='StatQuest',
+                    message=_('Unable to read the input file:\n{}')
+                    .format(ex))
+                return False
+            self._parsed_data_frames[key] = (data_frame, size)
+            self._forget_parsed(PARSED_CACHE_SIZE)
+            self._show(data_frame)
+            return True
+
+        self._poll = poll
+        poll()
+
+    def _forget_parsed(self, count):
+        # The least recently used data frames are forgotten until there are
+        # no more than count of them and they use no more than
+        # PARSED_CACHE_MEMORY bytes; the memory limit alone does not
+        # remove the most recent one.
+        #
+        parsed = self._parsed_data_frames
+        total = sum(size for __, size in parsed.values())
+        while parsed and (len(parsed) > count
+                          or len(parsed) > 1 and total > PARSED_CACHE_MEMORY):
+            __, size = parsed.pop(next(iter(parsed)))
+            total -= size
+
+    def _show(self, data_frame):
+        self._data_frame = data_frame
+        for i, name in enumerate(self._data_frame):
+            # Rows of widgets are pooled: a row made for a previous file
+            # is reconfigured, a new row is made only if there are more
+            # columns than ever before.
+            #
+            if i == len(self._rows):
+                variable = tk.BooleanVar()
+                checkbox = ttk.Checkbutton(
+                    self._frame,
+                    variable=variable,
+                    onvalue=True,
+                    offvalue=False)
+                ln = ttk.Label(self._frame, width=10)
+                lo = ttk.Label(self._frame, width=10)
+                lc = ttk.Label(self._frame, width=10)
+                self._rows.append((variable, checkbox, ln, lo, lc))
+            variable, checkbox, ln, lo, lc = self._rows[i]
+            variable.set(True)
+            checkbox['text'] = name
+            row = i + 2
+            checkbox.grid(row=row, column=1, sticky='we')
+            self._names.append(name)
+            self._variables.append(variable)
+
+            # Observables made here to show types of columns are kept,
+            # get_observables() uses them instead of making them again.
+            #
+            if name not in self._observables:
+                try:
+                    self._observables[name] = Observable(
+                        self._data_frame[name])
+                except:
+                    self._observables[name] = None
+            obs = self._observables[name]
+            if obs is not None:
+                ln['text'] = _('nominal') if obs.IS_NOMINAL else '--'
+                lo['text'] = _('ordinal') if obs.IS_ORDINAL else '--'
+                lc['text'] = _('continuous') if obs.IS_CONTINUOUS else '--'
+                ln.grid(row=row, column=2, sticky='w', padx=10)
+                lo.grid(row=row, column=3, sticky='w', padx=10)
+                lc.grid(row=row, column=4, sticky='w', padx=10)
+
     def set_locale(self, locale_code=None):
         self._code = locale_code
         self.update(self)
@@ -163,27 +335,47 @@ class Input(Component):
         self._file_name = file_name
         self.update(self)
 
+    def wait_for_data_frame(self):
+        """
+        Wait until the input file, if it is being parsed, is parsed and
+        its columns are shown; thus get_data_frame() and get_observables()
+        give the data of the file shown as the input file, not nothing.
+        A file which could not be read before is read again.
+
+        Returns:
+            bool: False if the input file could not be read, True otherwise.
+        """
+        self.update()
+        if self._future is not None:
+            return self._poll(wait=True)
+        return True
+
     def get_data_frame(self):
-        headers = []
-        for name, variable in self._name_variable_list:
-            if variable.get():
-                headers.append(name)
-        try:
-            df = self._data_frame.loc[:, headers]
-        except:
-            df = self._empty_data_frame
-        return df
+        headers = [name for name, variable in zip(self._names, self._variables)
+                   if variable.get()]
+        # Missing columns are checked before, because a KeyError raised
+        # by pandas (with a message listing the columns) is expensive.
+        #
+        columns = self._data_frame.columns
+        if not all(name in columns for name in headers):
+            return self._empty_data_frame
+        return self._data_frame.loc[:, headers]
 
     def get_observables(self):
         data_frame = self.get_data_frame()
         observables = []
         drop_threshold = self._parent_component.parameters.drop_too_short.get()
         for index in data_frame:
-            series = data_frame[index]
-            try:
-                obs = Observable(series)
-                if len(obs) >= drop_threshold:
-                    observables.append(obs)
-            except:
-                pass
+            # Observables are made once for each column of the data frame,
+            # None is for columns which cannot be observables. The same
+            # observables are thus keys in relations_cache in each run.
+            #
+            if index not in self._observables:
+                try:
+                    self._observables[index] = Observable(data_frame[index])
+                except:
+                    self._observables[index] = None
+            obs = self._observables[index]
+            if obs is not None and len(obs) >= drop_threshold:
+                observables.append(obs)
         return observables
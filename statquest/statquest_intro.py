@@ -40,7 +40,6 @@ import os
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-import re
 import sys
 import textwrap
 from tkinter import ttk
@@ -62,51 +61,57 @@ def dedentln(string):
         łańcuch znaków lepiej sformatowany, znaki nowej linii są usunięte
         jeżeli występowały pojedynczo.
     """
-    pattern = '(?<!\n)\n(?!\n)'
-    return re.sub(pattern, ' ', textwrap.dedent(string)).strip()
+    # A newline is lone if lines on both sides of it are not empty, such
+    # newline is replaced by a space. The lines are joined in one pass,
+    # without a regular expression with lookbehind and lookahead.
+    #
+    lines = textwrap.dedent(string).strip().split('\n')
+    return ''.join([lines[0]] + [(' ' if previous and line else '\n') + line
+                                 for previous, line in zip(lines, lines[1:])])
+
+
+# The default text is written already formatted, lines of a paragraph
+# are joined by the Python compiler, thus no dedentln is needed.
+#
+_INTRO_TEXT = (
+    'StatQuest - statistical methods for data analysis.\n'
+    '\n'
+    'The StatQuest program is intended for to statistical analysis '
+    'of nominal, ordinal and continuous data.\n'
+    '\n'
+    'An example of continuous data can be AAA cell voltage values '
+    'measured in volts. These will be values expressed in floating '
+    'point numbers like 1.45, 1.39, 1.52. In this case, we have '
+    'values for which the calculation makes sense arithmetic mean, '
+    'standard deviation, etc.\n'
+    '\n'
+    'Ordinal data is understood in StatQuest as data that can be '
+    'described with integers. Does it make sense to calculate the '
+    'average for such data? Might have, might not have. For example if '
+    'we will assign 1 as code to tall people and 0 to short people, '
+    'then it is calculated for a given population, the mean says '
+    'something about what percentage of people there are high in this '
+    'population. If we add code 2 for big city and code 3 for small '
+    'town... then the average makes no sense.\n'
+    '\n'
+    'Categorical data is data that cannot be expressed in numbers. '
+    'A good example would be the color of the eyes: blue, green, ... '
+    'Each value is expressed non-numerically, cannot be calculated '
+    'mean or standard deviation.')
 
 
 class Intro(Component):
     def __init__(self, parent_component, parent_frame, *args, **kwargs):
         super().__init__(parent_component, parent_frame, *args, **kwargs)
 
-        text = dedentln(
-            '''
-            StatQuest - statistical methods for data analysis.
-    
-            The StatQuest program is intended for to statistical analysis
-            of nominal, ordinal and continuous data. 
-    
-            An example of continuous data can be AAA cell voltage values 
-            measured in volts. These will be values expressed in floating 
-            point numbers like 1.45, 1.39, 1.52. In this case, we have
-            values for which the calculation makes sense arithmetic mean,
-            standard deviation, etc.
-    
-             Ordinal data is understood in StatQuest as data that can be
-             described with integers. Does it make sense to calculate the 
-             average for such data? Might have, might not have. For example if
-             we will assign 1 as code to tall people and 0 to short people,
-             then it is calculated for a given population, the mean says
-             something about what percentage of people there are high in this
-             population. If we add code 2 for big city and code 3 for small
-             town... then the average makes no sense.
-    
-             Categorical data is data that cannot be expressed in numbers.
-             A good example would be the color of the eyes: blue, green, ...
-             Each value is expressed non-numerically, cannot be calculated
-             mean or standard deviation.
-             '''
-        )
-
+        text = _INTRO_TEXT
         try:
             code = get_default_locale_code()
             with open(os.path.join('locale', code, 'intro.txt')) as file:
-                text = file.read()
+                text = dedentln(file.read())
         except:
             pass
 
-        text = dedentln(text)
         label = ttk.Label(self._frame, text=text)
         label.bind('<Configure>',
                    lambda event: label.config(wraplength=label.winfo_width()))
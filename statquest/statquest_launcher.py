@@ -38,9 +38,9 @@ Copyright (c) 2023 Sławomir Marczyński
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import threading
+import multiprocessing
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
 
 import ydata_profiling as pandas_profiling
 
@@ -52,6 +52,32 @@ from statquest_relation import Relation
 _ = setup_locale_translation_gettext()
 
 
+def make_profile(data_frame, file_name, need_correlations):
+    """
+    Make the ydata profile of data and save it in a file.
+
+    The function is run in a separate process, thus the memory used by
+    ydata_profiling is given back to the system when the profile is done.
+
+    Args:
+        data_frame (pandas.DataFrame): data to be profiled.
+        file_name (str): the name of the output (HTML) file.
+        need_correlations (bool): True if correlations should be computed.
+    """
+    # Without correlations the minimal (much faster) profile is made:
+    # it skips also interactions and other quadratic in the number
+    # of columns computations. The progress bar is shown by StatQuest,
+    # not printed by ydata_profiling.
+    #
+    plot_parameters = {"dpi": 300, "image_format": "png"}
+    profile_report = pandas_profiling.ProfileReport(
+        data_frame,
+        minimal=not need_correlations,
+        progress_bar=False,
+        plot=plot_parameters)
+    profile_report.to_file(file_name)
+
+
 class Launcher(Component):
     def __init__(self, parent_component, parent_frame, *args, **kwargs):
         super().__init__(parent_component, parent_frame, *args, **kwargs)
@@ -67,51 +93,77 @@ class Launcher(Component):
                     pass
 
         def engine():
-            def worker_proc(*args, **kwargs):
-                plot_parameters = {"dpi": 300, "image_format": "png"}
-                if parent_component.parameters.need_correlations.get():
-                    profile_report = pandas_profiling.ProfileReport(
-                        data_frame,
-                        plot=plot_parameters)
-                else:
-                    profile_report = pandas_profiling.ProfileReport(
-                        data_frame,
-                        correlations=None,
-                        plot=plot_parameters)
-                file_name = parent_component.files_names.profi_htm.get()
-                profile_report.to_file(file_name)
-
+            # A notification about a changed file name may be postponed and
+            # the input file may be still parsed in the background; the
+            # computations must run on the file shown as the input file,
+            # and they are not run at all if the file cannot be read.
+            #
+            parent_component.files_names.flush_callback()
+            if not parent_component.input.wait_for_data_frame():
+                return
+
+            # The α text may be not validated yet, the spinbox validates it
+            # only when it loses focus.
+            #
+            parent_component.parameters.check_alpha()
+
+            # The profile is made by another process, in parallel with
+            # the statistical tests. The process is spawned, not forked,
+            # because forking a process with threads (tkinter, the thread
+            # parsing input files) may deadlock the child.
+            #
+            worker = None
             if parent_component.parameters.need_profile.get():
                 data_frame = parent_component.input.get_data_frame()
                 if not data_frame.empty:
-                    self.progress.auto()
-                    data_frame = data_frame.copy()  # should defrag data_frame
-                    worker = threading.Thread(target=worker_proc)
+                    # The data frame is consolidated when the file is read,
+                    # selected columns need not to be copied to defrag them.
+                    #
+                    file_name = parent_component.files_names.profi_htm.get()
+                    need_correlations = (
+                        parent_component.parameters.need_correlations.get())
+                    worker = multiprocessing.get_context('spawn').Process(
+                        target=make_profile,
+                        args=(data_frame, file_name, need_correlations))
                     worker.start()
-                    while worker.is_alive():
-                        self.progress.update()
-                    self.progress.stop()
 
-            alpha = parent_component.parameters.alpha.get()
+            alpha = parent_component.parameters.alpha_value
             tests = parent_component.suite.get_selected()
             observables = parent_component.input.get_observables()
-            relations = Relation.create_relations(observables, tests,
-                                                  progress=self.progress)
+            relations = Relation.create_relations(
+                observables, tests, progress=self.progress,
+                cache=parent_component.input.relations_cache)
             significant_relations = Relation.credible_only(relations, alpha)
 
-            parent_component.output.tests_csv(relations, alpha)
-            parent_component.output.tests_dot(significant_relations)
-            parent_component.output.tests_nx(significant_relations)
+            if worker:
+                self.progress.auto()
+                while worker.is_alive():
+                    self.progress.update()
+                    worker.join(0.05)
+                self.progress.stop()
+                if worker.exitcode != 0:
+                    messagebox.showwarning(
+                        title='StatQuest',
+                        message=_('The Ydata Profile has not been made.'))
+
+            output = parent_component.output
+            output.tests_csv(relations, alpha)
+            graph = output.relations_graph(significant_relations)
+            output.tests_dot(graph)
+            output.tests_nx(graph)
 
         def callback(*args):
             enable_siblings(False)
             label['text'] = _('running computations')
             label['state'] = 'normal'
-            self._frame.master.update()
+            # Only redraw (geometry and display are idle tasks), thus the
+            # label is shown, but no events are handled before the run.
+            #
+            self._frame.master.update_idletasks()
             try:
                 engine()
             except Exception as ex:
-                tk.messagebox.showwarning(
+                messagebox.showwarning(
                     title='StatQuest',
                     message=_('Something goes wrong... missing data?\n'
                               'Check and run again.'))
@@ -43,7 +43,10 @@ import gettext
 import locale
 import os
 
+_LOCALE_DIRECTORY = os.path.join(os.path.dirname(__file__), 'locale')
+
 _setlocale_called = False
+_gettext_functions = {}
 
 
 def get_supported_locales():
@@ -76,8 +79,13 @@ def setup_locale_translation_gettext(messages_domain='messages'):
             i.e. a name of the mo-file.
 
     Returns:
-        gettext function to translate strings.
+        gettext function to translate strings; the function is created
+        only once for each messages' domain and then reused.
     """
+    try:
+        return _gettext_functions[messages_domain]
+    except KeyError:
+        pass
 
     # Reset all locale settings to the user's default settings.
     # Keep LC_NUMERIC to en_US due problems with tkinter and conflicts
@@ -111,10 +119,10 @@ def setup_locale_translation_gettext(messages_domain='messages'):
 
     # Construct and return translation object.
     #
-    directory = os.path.dirname(__file__)
-    localedir = os.path.join(directory, 'locale')
-    translation = gettext.translation(messages_domain, localedir=localedir,
+    translation = gettext.translation(messages_domain,
+                                      localedir=_LOCALE_DIRECTORY,
                                       languages=[lang], fallback=True)
+    _gettext_functions[messages_domain] = translation.gettext
     return translation.gettext
 
 
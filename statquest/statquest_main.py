@@ -38,6 +38,7 @@ Copyright (c) 2023 Sławomir Marczyński
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import multiprocessing
 import tkinter as tk
 
 import matplotlib
@@ -94,4 +95,5 @@ def main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # needed by PyInstaller on Windows
     main()
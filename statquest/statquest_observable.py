@@ -39,6 +39,8 @@ Copyright (c) 2023 Sławomir Marczyński.
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import numpy as np
+import pandas as pd
 from numpy import float32, float64, int32, int64
 
 import statquest_locale
@@ -85,43 +87,125 @@ class Observable:
         self.IS_CONTINUOUS = False
         self.IS_NOMINAL = False
         self.__classify_data_kind()
+        self._codes = None
+        self._categories = None
 
     def __classify_data_kind(self):
         # Kacze badanie typu. Założenie - nie mamy brakujących wartości (NaN),
         # te bowiem zostały już usunięte wcześniej.
         #
-        score_ordinal = 0
-        score_continuous = 0
-        score_nominal = 0
-        values = self.data.to_list()
-        for v in values:
-            try:
-                i = int(v)
-                if i == v:
-                    score_ordinal += 1
-            except:
-                pass
-            try:
-                f = float(v)
-                if f == v:
-                    score_continuous += 1
-            except:
-                pass
-            try:
-                s = str(v)
-                if s == v:
+        if not self.__classify_data_kind_by_dtype():
+            score_ordinal = 0
+            score_continuous = 0
+            score_nominal = 0
+            # Values are streamed from the series (as Python scalars), there
+            # is no need to copy the whole column into a list.
+            #
+            # A string is never equal to int or float, even if it can be
+            # converted to a number, thus there is no need to try (and fail)
+            # such conversions for strings.
+            #
+            for v in self.data:
+                if isinstance(v, str):
                     score_nominal += 1
-            except:
-                pass
-        length = len(values)
-        self.IS_ORDINAL = (score_ordinal == length)
-        self.IS_CONTINUOUS = (score_continuous == length)
-        self.IS_NOMINAL = (score_nominal == length)
+                    continue
+                try:
+                    i = int(v)
+                    if i == v:
+                        score_ordinal += 1
+                except (TypeError, ValueError, OverflowError):
+                    pass
+                try:
+                    f = float(v)
+                    if f == v:
+                        score_continuous += 1
+                except (TypeError, ValueError, OverflowError):
+                    pass
+            length = len(self.data)
+            self.IS_ORDINAL = (score_ordinal == length)
+            self.IS_CONTINUOUS = (score_continuous == length)
+            self.IS_NOMINAL = (score_nominal == length)
         if self.IS_ORDINAL or self.IS_CONTINUOUS:
             self.IS_NOMINAL = False
         if not (self.IS_ORDINAL or self.IS_CONTINUOUS or self.IS_NOMINAL):
             raise TypeError
 
+    def __classify_data_kind_by_dtype(self):
+        # Columns with numeric NumPy dtype are classified by whole-array
+        # operations, columns with pandas string dtype have only str values.
+        # The result is the same as for the loop over values in
+        # __classify_data_kind(), which is still used for other dtypes.
+        #
+        # Returns True if data has been classified, False otherwise.
+        #
+        dtype = self.data.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Every value is one of the categories, it is enough to classify
+            # the categories which are actually used.
+            #
+            used = np.unique(self.data.cat.codes.to_numpy())
+            kind = Observable(pd.Series(dtype.categories[used]))
+            self.IS_ORDINAL = kind.IS_ORDINAL
+            self.IS_CONTINUOUS = kind.IS_CONTINUOUS
+            self.IS_NOMINAL = kind.IS_NOMINAL
+            return True
+        if isinstance(dtype, pd.StringDtype):
+            self.IS_ORDINAL = False
+            self.IS_CONTINUOUS = False
+            self.IS_NOMINAL = True
+            return True
+        if not isinstance(dtype, np.dtype) or dtype.kind not in 'biuf':
+            return False
+        values = self.data.to_numpy()
+        if dtype.kind == 'f':
+            self.IS_ORDINAL = bool(np.all(np.isfinite(values)
+                                          & (np.floor(values) == values)))
+            self.IS_CONTINUOUS = True
+        else:
+            # Integers greater than 2**53 may be not exactly convertible
+            # to float, the loop over values decides in such case.
+            #
+            if dtype.kind != 'b' and np.any(np.abs(values) > 2 ** 53):
+                return False
+            self.IS_ORDINAL = True
+            self.IS_CONTINUOUS = True
+        self.IS_NOMINAL = False
+        return True
+
+    def __factorize(self):
+        # Values are encoded as int32 codes only once, tests on nominal
+        # data can then count codes instead of hashing values again and
+        # again for each pair of observables.
+        #
+        codes, categories = pd.factorize(self.data, sort=True)
+        self._codes = codes.astype(int32)
+        self._categories = np.asarray(categories, dtype=object)
+
+    @property
+    def codes(self):
+        """
+        Values of the observable encoded as integer codes.
+
+        Returns:
+            numpy.ndarray: int32 codes, i-th code is for i-th value in data;
+                the code is the index of the value in categories.
+        """
+        if self._codes is None:
+            self.__factorize()
+        return self._codes
+
+    @property
+    def categories(self):
+        """
+        Sorted distinct values of the observable.
+
+        Returns:
+            numpy.ndarray: distinct values, indexed by codes.
+        """
+        if self._categories is None:
+            self.__factorize()
+        return self._categories
+
     def __getitem__(self, key):
         """
         Return a value for the given key.
@@ -137,6 +221,21 @@ class Observable:
         """
         return self.data[key]
 
+    def __contains__(self, key):
+        """
+        Check if there is a value for the given key.
+
+        The key is looked up in the (hashed) index of the data, thus the
+        check does not scan the values.
+
+        Args:
+            key: a key, for example an identifier of a row.
+
+        Returns:
+            bool: True if the observable has a value for the key.
+        """
+        return key in self.data.index
+
     def __len__(self):
         """
         Get observable size.
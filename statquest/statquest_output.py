@@ -51,6 +51,11 @@ _ = statquest_locale.setup_locale_translation_gettext()
 
 CSV_SEPARATOR = ';'
 
+# Output files are written with a large buffer, many small writes then
+# cost only a few system calls.
+#
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 class Output:
     def __init__(self, parent_component):
@@ -69,22 +74,60 @@ class Output:
             alpha (float): the alpha level
         """
         file_name = self.parent_component.files_names.tests_csv.get()
-        with open(file_name, "wt", encoding='utf-8', newline='') as file:
+        with open(file_name, "wt", encoding='utf-8', newline='',
+                  buffering=OUTPUT_BUFFER_SIZE) as file:
             csv_writer = csv.writer(file, delimiter=CSV_SEPARATOR)
             csv_writer.writerow((
                 _('data1'), _('data2'),
                 _('related?'),
                 _('test'), _('stat'),
                 _('value'), _('p_value')))
-            relations_list = list(chain.from_iterable(relations.values()))
-            for relation in relations_list:
-                csv_writer.writerow((
-                    relation.observable1, relation.observable2,
-                    relation.credible(alpha),
-                    relation.test.name, relation.test.stat_name,
-                    relation.value, relation.p_value))
-
-    def tests_dot(self, relations):
+            csv_writer.writerows(
+                (relation.observable1, relation.observable2,
+                 relation.credible(alpha),
+                 relation.test.name, relation.test.stat_name,
+                 relation.value, relation.p_value)
+                for relation in chain.from_iterable(relations.values()))
+
+    @staticmethod
+    def relations_graph(relations):
+        """
+        Build the graph of relations.
+
+        The graph is built once and then it can be used both to write
+        DOT file and to draw the graph. Each edge has the label attribute
+        describing the tests, the same as in DOT file, the ends attribute
+        with the pair (a, b) and the order attribute with the position of
+        the pair in relations. MultiGraph keeps neither the order
+        of edges nor the order of their ends, thus these attributes are
+        needed to write DOT file in the same order as relations.
+
+        Note:
+            The MultiGraph is used because there can be relations (a, b)
+            and (b, a) for tests which are not symmetric.
+
+        Args:
+            relations (dict(Relations)): an dictionary where keys are
+                pairs of relations (a, b) and values are Relations.
+
+        Returns:
+            networkx.MultiGraph: the graph of relations.
+        """
+        graph = nx.MultiGraph()
+        for order, ((a, b), rlist) in enumerate(relations.items()):
+            label = []
+            for r in rlist:
+                if r.test.prove_relationship:
+                    s = f'{r.test.name_short} p = {r.p_value:#.4}'
+                else:
+                    s = f'{r.test.name_short} 1-p = ' \
+                        f'{1 - r.p_value:#.4}'
+                label.append(s)
+            graph.add_edge(a, b, label='\\n'.join(label), ends=(a, b),
+                           order=order)
+        return graph
+
+    def tests_dot(self, graph):
         """
         Write graph of relations.
 
@@ -96,53 +139,38 @@ class Output:
             }
 
         Note:
-            Function _write_relations_dot writes all relations given as
-            a parameter. However, it can be applied selectively to a subset
-            of relations. We can segregate relationships according to
-            established criteria before call write_dot and then use
-            write_dot to show only specifically selected relations.
+            Method tests_dot writes all relations given as a parameter.
+            However, it can be applied selectively to a subset of relations.
+            We can segregate relationships according to established criteria
+            before call relations_graph and then use tests_dot to show only
+            specifically selected relations.
 
         Args:
-            relations (dict(Relations)): an dictionary where keys are
-                pairs of relations (a, b) and values are Relations.
-                Notice that Relations are containers for Relation objects.
-            file (file):  _output_content_to_file file.
+            graph (networkx.MultiGraph): the graph of relations created
+                by relations_graph().
         """
         file_name = self.parent_component.files_names.tests_dot.get()
-        with open(file_name, "wt", encoding='utf-8', newline='') as file:
-            if relations:
-                print('graph {', file=file)
-                for (a, b), rlist in relations.items():
-                    label = []
-                    for r in rlist:
-                        if r.test.prove_relationship:
-                            s = f'{r.test.name_short} p = {r.p_value:#.4}'
-                        else:
-                            s = f'{r.test.name_short} 1-p = ' \
-                                f'{1 - r.p_value:#.4}'
-                        label.append(s)
-                    label = '\\n'.join(label)
-                    print(f'"{a}" -- "{b}" [ label="{label}" ]', file=file)
-                print('}', file=file)
-
-    def tests_nx(self, relations):
+        with open(file_name, "wt", encoding='utf-8', newline='',
+                  buffering=OUTPUT_BUFFER_SIZE) as file:
+            if graph:
+                lines = ['graph {']
+                edges = sorted(graph.edges(data=True),
+                               key=lambda edge: edge[2]['order'])
+                for __, __, data in edges:
+                    a, b = data['ends']
+                    lines.append(f'"{a}" -- "{b}" [ label="{data["label"]}" ]')
+                lines.append('}\n')
+                file.write('\n'.join(lines))
+
+    def tests_nx(self, graph):
         """
+        Draw graph of relations.
+
+        Args:
+            graph (networkx.MultiGraph): the graph of relations created
+                by relations_graph().
         """
-        if relations:
-            graph = nx.Graph()
-            for (a, b), rlist in relations.items():
-                label = []
-                for r in rlist:
-                    if r.test.prove_relationship:
-                        s = f'{r.test.name_short} p = {r.p_value:#.4}'
-                    else:
-                        s = f'{r.test.name_short} 1-p = ' \
-                            f'{1 - r.p_value:#.4}'
-                    label.append(s)
-                label = '\\n'.join(label)  # @todo: ???
-                graph.add_node(a)
-                graph.add_node(b)
-                graph.add_edge(a, b)
+        if graph:
             options = {
                 "font_size": 8,
                 "node_size": 1500,
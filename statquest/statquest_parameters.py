@@ -49,6 +49,51 @@ from statquest_locale import get_default_locale_code, get_supported_locales, \
 _ = setup_locale_translation_gettext()
 
 
+# Validators do not depend on a Parameters object, they are module level
+# functions, not closures made again for each object.
+#
+def _alpha_validator(string):
+    """
+    Sprawdza czy wartość wpisana w kontrolkę jest liczbą z przedziału
+    od 0 do 1, czyli mogącą określać prawdopodobieństwo.
+
+    Args:
+        string (str): wpisana liczba jako napis.
+
+    Returns:
+        True jeżeli walidacja zakończyła się pomyślnie, False jeżeli
+        nie powiodła się.
+    """
+    if not string:
+        return False
+    try:
+        value = float(string)
+    except ValueError:
+        return False
+    return 0 <= value <= 1
+
+
+def _drop_too_short_validator(string):
+    """
+    Sprawdza czy wartość wpisana w kontrolkę jest liczbą całkowitą
+    większą od 1, czyli mogącą być progiem liczby danych.
+
+    Args:
+        string (str): wpisana liczba jako napis.
+
+    Returns:
+        True jeżeli walidacja zakończyła się pomyślnie, False jeżeli
+        nie powiodła się.
+    """
+    if not string:
+        return False
+    try:
+        value = int(string)
+    except ValueError:
+        return False
+    return value > 1
+
+
 class Parameters(Component):
     """
     Konfigurowanie parametrów pracy programu.
@@ -61,120 +106,149 @@ class Parameters(Component):
         assert 0 <= DEFAULT_ALPHA_LEVEL <= 1.0
 
         self.alpha = tk.DoubleVar(value=DEFAULT_ALPHA_LEVEL)
+        self.alpha_value = DEFAULT_ALPHA_LEVEL
         self.need_profile = tk.BooleanVar(value=False)
         self.need_correlations = tk.BooleanVar(value=False)
         self.locale_code = tk.StringVar(value=get_default_locale_code())
         self.drop_too_short = tk.IntVar(value=2)
 
-        def alpha_validator(string):
-            """
-            Sprawdza czy wartość wpisana w kontrolkę jest liczbą z przedziału
-            od 0 do 1, czyli mogącą określać prawdopodobieństwo.
-
-            Args:
-                string (str): wpisana liczba jako napis.
+        registred_alpha_validator = self._frame.register(_alpha_validator)
 
-            Returns:
-                True jeżeli walidacja zakończyła się pomyślnie, False jeżeli
-                nie powiodła się.
+        def alpha_invalid():
             """
-            try:
-                value = float(string)
-                return 0 <= value <= 1
-            except:
-                return False
+            Restore the last valid α when the edited text is not valid.
 
-        registred_alpha_validator = self._frame.register(alpha_validator)
+            Tk turns the validation off when the text is changed by this
+            command, thus the validation is turned on again (when idle).
+            """
+            self.alpha.set(self.alpha_value)
+            spinbox_alpha.after_idle(
+                lambda: spinbox_alpha.configure(validate='focusout'))
 
-        def drop_too_short_validator(string):
-            try:
-                value = int(string)
-                return value > 1
-            except:
-                return False
+        registred_alpha_invalid = self._frame.register(alpha_invalid)
 
         registred_drop_to_short = self._frame.register(
-            drop_too_short_validator)
+            _drop_too_short_validator)
+
+        def callback_alpha(*args):
+            """
+            Parse α once, when it is changed, and keep the last valid value
+            in alpha_value; alpha.get() fails for a text which is not
+            a number, e.g. for an empty field while the value is edited.
+
+            Args:
+                *args: needed for tkinker callback
+            """
+            try:
+                value = self.alpha.get()
+            except tk.TclError:
+                return
+            if 0 <= value <= 1:
+                self.alpha_value = value
 
         def callback_correlations(*args):
             checkbox_correlations['state'] = (
                 'normal' if self.need_profile.get() else 'disabled')
-            self.callback(*args)
 
-        self.alpha.trace_add('write', self.callback)
+        # Listeners are notified only when the locale is changed, because
+        # only the locale changes how the input file is read. Other
+        # parameters are read when computations are run.
+        #
+        self.alpha.trace_add('write', callback_alpha)
         self.need_profile.trace_add('write', callback_correlations)
-        self.need_correlations.trace_add('write', self.callback)
-        self.locale_code.trace_add('write', self.callback)
 
         label = ttk.Label(self._frame, text=_('Parameters'))
-        label.grid(row=0, column=0, columnspan=4, sticky='w')
+        label.grid(row=0, column=0, columnspan=4, sticky='w', padx=5, pady=5)
 
         label_alpha = ttk.Label(
             self._frame,
             text=_('The significance level α for p-value:'))
-        label_alpha.grid(row=1, column=0, sticky='e')
+        label_alpha.grid(row=1, column=0, sticky='e', padx=5, pady=5)
 
+        # The α value is validated when the spinbox loses focus, not after
+        # each key pressed; a not finished text, e.g. empty or '0.', is not
+        # rejected while it is being edited.
+        #
         spinbox_alpha = ttk.Spinbox(
             self._frame, from_=0, to=1, increment=0.01, format="%.2f",
             width=10,
             textvariable=self.alpha,
-            validate='all', validatecommand=(registred_alpha_validator, '%P'))
-        spinbox_alpha.grid(row=1, column=1, sticky='w')
+            validate='focusout',
+            validatecommand=(registred_alpha_validator, '%P'),
+            invalidcommand=registred_alpha_invalid)
+        spinbox_alpha.grid(row=1, column=1, sticky='w', padx=5, pady=5)
+        self._spinbox_alpha = spinbox_alpha
         label_alpha_comment = ttk.Label(
             self._frame,
             text=_('The α value is a probability, therefore 0 ⩽ α ⩽ 1.'))
-        label_alpha_comment.grid(row=1, column=2, sticky='w')
+        label_alpha_comment.grid(row=1, column=2, sticky='w', padx=5, pady=5)
 
         checkbox_profile = ttk.Checkbutton(
             self._frame,
             text=_('should generate Ydata Profile'),
             variable=self.need_profile, onvalue=True, offvalue=False)
-        checkbox_profile.grid(row=2, column=0, sticky='w')
+        checkbox_profile.grid(row=2, column=0, sticky='w', padx=5, pady=5)
         label_profile_comment = ttk.Label(
             self._frame,
             text=_('This option is not dependent on tests.'))
-        label_profile_comment.grid(row=2, column=2, sticky='w')
+        label_profile_comment.grid(row=2, column=2, sticky='w', padx=5, pady=5)
         checkbox_correlations = ttk.Checkbutton(
             self._frame,
             text=_('should compute correlations in Ydata Profile '),
             variable=self.need_correlations,
             onvalue=True, offvalue=False)
-        checkbox_correlations.grid(row=3, column=0, sticky='w')
+        checkbox_correlations.grid(row=3, column=0, sticky='w', padx=5, pady=5)
         label_profile_comment_correlations = ttk.Label(
             self._frame,
             text=_('Turn on correlations in Ydata Profile.'))
-        label_profile_comment_correlations.grid(row=3, column=2, sticky='w')
+        label_profile_comment_correlations.grid(row=3, column=2, sticky='w',
+                                                padx=5, pady=5)
 
         label_locale = ttk.Label(self._frame, text=_('locale settings:'))
-        label_locale.grid(row=4, column=0, sticky='e')
+        label_locale.grid(row=4, column=0, sticky='e', padx=5, pady=5)
+        # The locale code can be only selected from the list, not typed;
+        # listeners are notified once, when a code is selected, because
+        # they may read the input file again with other settings.
+        #
         combobox_locale = ttk.Combobox(self._frame, width=8,
-                                       textvariable=self.locale_code)
-        combobox_locale.grid(row=4, column=1, sticky='w')
-        combobox_locale['values'] = get_supported_locales()
+                                       textvariable=self.locale_code,
+                                       values=get_supported_locales(),
+                                       state='readonly')
+        combobox_locale.grid(row=4, column=1, sticky='w', padx=5, pady=5)
+        combobox_locale.bind('<<ComboboxSelected>>', self.callback)
         label_locale_comment = ttk.Label(
             self._frame,
             text=_('The decimal separator, the CSV separator encodings.'))
-        label_locale_comment.grid(row=4, column=2, sticky='w')
+        label_locale_comment.grid(row=4, column=2, sticky='w', padx=5, pady=5)
 
         label_drop = ttk.Label(
             self._frame,
             text=_('the data threshold:'))
-        label_drop.grid(row=5, column=0, sticky='e')
+        label_drop.grid(row=5, column=0, sticky='e', padx=5, pady=5)
         spinbox_drop = ttk.Spinbox(
             self._frame, from_=2, to=1000000, increment=1,
             width=10,
             textvariable=self.drop_too_short,
             validate='all', validatecommand=(registred_drop_to_short, '%P'))
-        spinbox_drop.grid(row=5, column=1, sticky='w')
+        spinbox_drop.grid(row=5, column=1, sticky='w', padx=5, pady=5)
         leabel_drop_comment = ttk.Label(
             self._frame,
             text=_("If the amount of data in the column is less than the"
                    " threshold, then whole column will be rejected as not"
                    " representative of the data."))
-        leabel_drop_comment.grid(row=5, column=2, sticky='w')
-
-        for widget in self._frame.winfo_children():
-            widget.grid_configure(padx=5, pady=5)
+        leabel_drop_comment.grid(row=5, column=2, sticky='w', padx=5, pady=5)
 
         callback_correlations()
         self.callback()
+
+    def check_alpha(self):
+        """
+        Validate the α text now, not when the spinbox loses focus.
+
+        The spinbox may still have the focus, e.g. when the Run button
+        is clicked, thus a text like 1.5 could be shown while the last
+        valid α is used. Such text is replaced by the last valid α, thus
+        alpha_value is always the value shown.
+        """
+        if not _alpha_validator(self._spinbox_alpha.get()):
+            self.alpha.set(self.alpha_value)
@@ -95,7 +95,7 @@ class Relation:
         return self.p_value > 1.0 - alpha
 
     @staticmethod
-    def create_relations(observables, tests, progress=None):
+    def create_relations(observables, tests, progress=None, cache=None):
         """
         Relationship factory. All possible relationships are created.
 
@@ -103,6 +103,10 @@ class Relation:
             observables (iterable): a collection of Observables.
             tests (iterable): a collection of Tests.
             progress (progress.Progress): an optional Progress object.
+            cache (dict): an optional mapping of (a, b, test) to a relation,
+                or to None if the test cannot be (or failed to be) carried
+                out; it is used and updated, thus the same cache passed
+                again saves computing the same relations once more.
 
         Returns:
             dict: the mapping of tuples (a, b) to relations.
@@ -113,6 +117,37 @@ class Relation:
             return relations
         known_pairs = set((a, a) for a in observables)
         known_triplets = set()
+
+        # Some tests can be carried out for all pairs at once, much faster
+        # than pair by pair. Relations missing there are computed below.
+        # Only observables in pairs not found in the cache are given to
+        # the batch; when all pairs are cached there is nothing to batch.
+        #
+        batches = {}
+        for test in tests:
+            if cache is None:
+                needed = observables
+            else:
+                missing = set()
+                for a in observables:
+                    for b in observables:
+                        if a is b or (a, b, test) in cache:
+                            continue
+                        if test.is_symetric and (b, a, test) in cache:
+                            continue
+                        missing.add(a)
+                        missing.add(b)
+                needed = [a for a in observables if a in missing]
+            try:
+                batches[test] = test.batch(needed) if needed else {}
+            except Exception:
+                batches[test] = {}
+
+        # Sets of keys do not depend on tests, nor on the other observable,
+        # thus they are made only once for each observable.
+        #
+        keys = {a: set(a.data.keys()) for a in observables}
+
         if progress:
             progress.range(len(observables))
         for a in observables:
@@ -122,48 +157,43 @@ class Relation:
                 if (a, b) in known_pairs:
                     continue
                 known_pairs.add((a, b))
+                if len(keys[a] & keys[b]) < 2:
+                    print(_('{} cannot be tested vs. {}').format(a, b),
+                          file=sys.stderr)
+                    if cache is not None:
+                        for test in tests:
+                            cache[(a, b, test)] = None
+                    continue
                 rel = []
                 for test in tests:
-                    if test in known_triplets:
+                    # A symmetric test has been already carried out for (b, a)
+                    # if the pair (a, b) is in known triplets.
+                    #
+                    if (a, b, test) in known_triplets:
                         continue
                     known_triplets.add((a, b, test))
                     if test.is_symetric:
                         known_triplets.add((b, a, test))
-                    if len(set(a.data.keys()) & set(b.data.keys())) < 2:
-                        print(_('{} cannot be tested vs. {}').format(a, b),
-                              file=sys.stderr)
-                        continue
-                    if test.can_be_carried_out(a, b):
+                    if cache is not None and (a, b, test) in cache:
+                        relation = cache[(a, b, test)]
+                    elif (a, b) in batches[test]:
+                        relation = batches[test][(a, b)]
+                    elif test.can_be_carried_out(a, b):
                         try:
-                            rel.append(test(a, b))
+                            relation = test(a, b)
                         except:
                             print(_('Unable perform {} for {} vs. {}')
                                   .format(test, a, b),
                                   file=sys.stderr)
+                            relation = None
+                    else:
+                        relation = None
+                    if cache is not None:
+                        cache[(a, b, test)] = relation
+                    if relation is not None:
+                        rel.append(relation)
                 relations[(a, b)] = rel
 
-        # For symmetric relations remove (b, a) relation
-        # when is known (a, b) relation.
-        #
-        if progress:
-            progress.range(len(observables))
-        for a in observables:
-            if progress:
-                progress.step()
-            for b in observables:
-                try:
-                    relations_a_b = relations[(a, b)]
-                    relations_b_a = relations[(b, a)]
-                except KeyError:
-                    continue
-                for ab in relations_a_b:
-                    to_remove = []
-                    for ba in relations_b_a:
-                        if ab.test == ba.test and ab.test.is_symetric:
-                            to_remove.append(ba)
-                    for r in to_remove:
-                        relations_b_a.remove(r)
-
         # Remove empty entries in relations.
         #
         if progress:
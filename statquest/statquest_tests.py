@@ -43,8 +43,8 @@ Authors:
 
 import warnings
 from abc import ABC, abstractmethod
-from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
@@ -136,6 +136,23 @@ class Test(ABC):
         """
         return False  # Should/must be overridden in subclasses.
 
+    def batch(self, observables):
+        """
+        Perform the test on many pairs of observables at once.
+
+        Subclasses can override this method when the test can be computed
+        for all pairs together faster than pair by pair. Pairs omitted in
+        the result are tested by __call__ as usual.
+
+        Args:
+            observables (iterable): a collection of Observables.
+
+        Returns:
+            dict: the mapping of tuples (a, b) to Relation objects, by
+                default empty.
+        """
+        return {}
+
 
 class ChiSquareIndependenceTest(Test):  # pylint: disable=C0111
     """
@@ -209,7 +226,21 @@ class ChiSquareIndependenceTest(Test):  # pylint: disable=C0111
         """
         if not self.can_be_carried_out(a, b):
             raise TypeError
-        ctab = pd.crosstab(a.data, b.data)
+
+        # The contingency table is counted from int32 codes of values
+        # (see Observable.codes), it is the same as pd.crosstab(a.data,
+        # b.data) but without hashing values for every pair of observables.
+        #
+        index = a.data.index.intersection(b.data.index)
+        codes_a = a.codes[a.data.index.get_indexer(index)]
+        codes_b = b.codes[b.data.index.get_indexer(index)]
+        n_a = len(a.categories)
+        n_b = len(b.categories)
+        ctab = np.bincount(codes_a.astype(np.int64) * n_b + codes_b,
+                           minlength=n_a * n_b).reshape(n_a, n_b)
+        rows = ctab.any(axis=1)
+        columns = ctab.any(axis=0)
+        ctab = ctab[rows][:, columns]
         chisq, p_value, dof, expected = stats.chi2_contingency(ctab)
         return Relation(a, b, self, chisq, p_value)
 
@@ -322,15 +353,19 @@ class KruskalWallisTest(Test):  # pylint: disable=C0111
         if on or cn or co:
             a, b = b, a
 
-        # We collect all keys common for both observables.
-        # And construct a mapping (dictionary) from a-values to b-values.
+        # We collect all keys common for both observables at once.
+        # Then b-values are grouped by a-values, i.e. by codes of a-values
+        # (see Observable.codes), sorting them and splitting where the code
+        # changes.
         #
-        keys = set(a.data.keys()) & set(b.data.keys())
-        observed = defaultdict(list)
-        for k in keys:
-            observed[a[k]].append(b[k])
-
-        h, p_value = stats.kruskal(*list(observed.values()))
+        index = a.data.index.intersection(b.data.index)
+        codes = a.codes[a.data.index.get_indexer(index)]
+        values = b.data.to_numpy(dtype=float)[b.data.index.get_indexer(index)]
+        order = np.argsort(codes, kind='stable')
+        splits = np.flatnonzero(np.diff(codes[order])) + 1
+        observed = np.split(values[order], splits)
+
+        h, p_value = stats.kruskal(*observed)
         return Relation(a, b, self, h, p_value)
 
     def can_be_carried_out(self, a, b):
@@ -452,14 +487,87 @@ class PearsonCorrelationTest(Test):  # pylint: disable=C0111
 
         df = pd.merge(a.data, b.data, left_index=True, right_index=True)
         df = df.dropna()
-        x = df.iloc[:, 0]
-        y = df.iloc[:, 1]
+        # Values are converted to float the same way as in batch(), thus
+        # e.g. True/False values of object type are accepted by both.
+        #
+        x = df.iloc[:, 0].to_numpy(dtype=np.float64, na_value=np.nan)
+        y = df.iloc[:, 1].to_numpy(dtype=np.float64, na_value=np.nan)
 
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore')
             r, p_value = stats.pearsonr(x, y)
         return Relation(a, b, self, r, p_value)
 
+    def batch(self, observables):
+        """
+        Perform the test on all pairs of observables at once.
+
+        Observables are stacked as columns of one matrix, with NaN where
+        an observable has no value for a row (key). Sums needed for the
+        correlation coefficients of every pair are then computed by matrix
+        products with the mask of present values, thus each pair uses only
+        the rows present in both observables (pairwise deletion), as in
+        the test made for the pair alone. P-values come from the
+        t-distribution, for all pairs together.
+
+        Note:
+            Pairs with less than three common rows are not computed here.
+            Observables are chosen by can_be_carried_out() and values
+            are converted to float, the same as for the test made pair
+            by pair, thus both give relations for the same pairs.
+
+        Args:
+            observables (iterable): a collection of Observables.
+
+        Returns:
+            dict: the mapping of tuples (a, b) to Relation objects.
+        """
+        # The condition in can_be_carried_out() is made for each of the
+        # observables separately, thus it is enough to check each one
+        # as a pair with itself.
+        #
+        observables = [obs for obs in observables
+                       if self.can_be_carried_out(obs, obs)]
+        if len(observables) < 2:
+            return {}
+        if not all(obs.data.index.is_unique for obs in observables):
+            return {}
+        index = observables[0].data.index
+        for obs in observables[1:]:
+            if not index.equals(obs.data.index):
+                index = index.union(obs.data.index)
+        x = np.column_stack([obs.data.reindex(index).to_numpy(
+                                dtype=np.float64, na_value=np.nan)
+                             for obs in observables])
+        mask = ~np.isnan(x)
+        # Values are shifted by the mean of each column, the correlation
+        # does not change but sums of squares below are much more precise.
+        #
+        x = np.where(mask, x - np.nanmean(x, axis=0), 0.0)
+        m = mask.astype(np.float64)
+        n = m.T @ m  # n[i, j] is the number of rows common to i and j
+        sx = x.T @ m  # sx[i, j] is the sum of x[:, i] over these rows
+        sxx = (x * x).T @ m
+        sxy = x.T @ x
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sxy - sx * sx.T / n
+            var = sxx - sx * sx / n
+            # Data constant over the rows of a pair have zero variance,
+            # but rounding errors leave small residuals; r must be NaN,
+            # as given by scipy.stats.pearsonr for constant data.
+            #
+            var[var <= 1e-12 * sxx] = np.nan
+            r = np.clip(cov / np.sqrt(var * var.T), -1.0, 1.0)
+            t = r * np.sqrt((n - 2) / (1.0 - r * r))
+            p_value = 2.0 * stats.t.sf(np.abs(t), n - 2)
+        relations = {}
+        for i, a in enumerate(observables):
+            for j, b in enumerate(observables):
+                if i != j and n[i, j] >= 3:
+                    relations[(a, b)] = Relation(a, b, self,
+                                                 r[i, j], p_value[i, j])
+        return relations
+
 
 class SpearmanRTest(Test):  # pylint: disable=C0111
     """
@@ -22,6 +22,22 @@ from typing import Container
 from statquest_input import *
 
 
+class TestCompactDataFrame(TestCase):
+
+    def test_compact_data_frame_1(self):
+        """category and downcast"""
+        df = pd.DataFrame(data={'i': [1, 2, 3, 4, 5],
+                                'f': [0.5, 1.5, 2.5, 3.5, 4.5],
+                                's': ['a', 'b', 'a', 'a', 'b'],
+                                'u': ['a', 'b', 'c', 'd', 'e']})
+        df = compact_data_frame(df)
+        self.assertEqual('int8', df['i'].dtype)
+        self.assertEqual('float64', df['f'].dtype)
+        self.assertEqual('category', df['s'].dtype)
+        self.assertNotEqual('category', df['u'].dtype)
+        self.assertEqual(['a', 'b', 'a', 'a', 'b'], df['s'].to_list())
+
+
 class TestInput(TestCase):
 
     pass
@@ -32,6 +32,12 @@ class TestSetupLocaleTranslationGettext(TestCase):
         translation = translator(source)
         self.assertEqual(source, translation)
 
+    def test_3(self):
+        """gettext function is reused"""
+        translator1 = setup_locale_translation_gettext()
+        translator2 = setup_locale_translation_gettext()
+        self.assertIs(translator1, translator2)
+
 
 class TestSetupLocaleCSV(TestCase):
 
@@ -80,6 +80,51 @@ class TestObservable(TestCase):
             obs = Observable('O', {})
             self.assertIsNone(obs)
 
+    def test___init__6(self):
+        """create ordinal from integral float values"""
+        obs = Observable(pd.Series([1.0, 2.0, float('nan'), -3.0], name='x'))
+        self.assertTrue(obs.IS_ORDINAL)
+        self.assertTrue(obs.IS_CONTINUOUS)
+        self.assertFalse(obs.IS_NOMINAL)
+        obs = Observable(pd.Series([1.0, 2.5, float('inf')], name='x'))
+        self.assertFalse(obs.IS_ORDINAL)
+        self.assertTrue(obs.IS_CONTINUOUS)
+        self.assertFalse(obs.IS_NOMINAL)
+
+    def test___init__7(self):
+        """create nominal from string dtype"""
+        data = pd.Series(['12', '3.5', 'abc'], name='x', dtype='string')
+        obs = Observable(data)
+        self.assertFalse(obs.IS_ORDINAL)
+        self.assertFalse(obs.IS_CONTINUOUS)
+        self.assertTrue(obs.IS_NOMINAL)
+        obs = Observable(data.astype(object))
+        self.assertFalse(obs.IS_ORDINAL)
+        self.assertFalse(obs.IS_CONTINUOUS)
+        self.assertTrue(obs.IS_NOMINAL)
+
+    def test___init__8(self):
+        """create from categorical data"""
+        data = pd.Series(['b', 'a', None, 'b'], name='x', dtype='category')
+        obs = Observable(data)
+        self.assertFalse(obs.IS_ORDINAL)
+        self.assertFalse(obs.IS_CONTINUOUS)
+        self.assertTrue(obs.IS_NOMINAL)
+        data = pd.Series([3, 1, 3], name='x', dtype='category')
+        obs = Observable(data)
+        self.assertTrue(obs.IS_ORDINAL)
+        self.assertTrue(obs.IS_CONTINUOUS)
+        self.assertFalse(obs.IS_NOMINAL)
+
+    def test___init__9(self):
+        """create from values of mixed types"""
+        obs = Observable(pd.Series([1, 2.5, True], name='x', dtype=object))
+        self.assertFalse(obs.IS_ORDINAL)
+        self.assertTrue(obs.IS_CONTINUOUS)
+        self.assertFalse(obs.IS_NOMINAL)
+        with self.assertRaises(TypeError):
+            Observable(pd.Series([1, 'a', None], name='x', dtype=object))
+
     def test___getitem__1(self):
         """Access to observable data"""
         for i in range(1, self.N + 1):
@@ -111,6 +156,15 @@ class TestObservable(TestCase):
             self.assertEqual(float(100 * i + 0.5), vc)
             self.assertEqual(str(100 * i), vn)
 
+    def test___contains__1(self):
+        """Check keys of observable data"""
+        data = pd.Series({1: 'b', 2: None, 4: 'b'}, name='x')
+        obs = Observable(data)
+        self.assertIn(1, obs)
+        self.assertNotIn(2, obs)
+        self.assertNotIn(3, obs)
+        self.assertNotIn('b', obs)
+
     def test___len__1(self):
         """Length of data"""
         lo = len(self.observable_ordinal)
@@ -125,3 +179,11 @@ class TestObservable(TestCase):
         self.assertEqual('di', str(self.observable_ordinal))
         self.assertEqual('df', str(self.observable_continuous))
         self.assertEqual('ds', str(self.observable_nominal))
+
+    def test_codes_1(self):
+        """Codes and categories of nominal data"""
+        data = pd.Series({1: 'b', 2: 'a', 4: 'b', 5: 'c'}, name='x')
+        obs = Observable(data)
+        self.assertEqual(['a', 'b', 'c'], list(obs.categories))
+        self.assertEqual([1, 0, 1, 2], list(obs.codes))
+        self.assertEqual(list(data), list(obs.categories[obs.codes]))
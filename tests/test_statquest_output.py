@@ -14,6 +14,7 @@ Copyright (c) 2023 Sławomir Marczyński.
 """
 
 import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, Mock
 
@@ -54,3 +55,40 @@ class TestOutput(TestCase):
         relations = {(Mock(), Mock()): [Mock(), Mock(), Mock()]}
         alpha = 0.05
         output.tests_csv(relations, alpha)
+
+    @staticmethod
+    def relation_mock(p_value=0.01):
+        relation = Mock()
+        relation.p_value = p_value
+        return relation
+
+    def test_relations_graph(self):
+        a, b, c = Mock(), Mock(), Mock()
+        r = self.relation_mock
+        relations = {(a, b): [r(), r()], (b, a): [r()], (a, c): []}
+        graph = Output.relations_graph(relations)
+        self.assertEqual(3, graph.number_of_nodes())
+        self.assertEqual(3, graph.number_of_edges())
+
+    def test_tests_dot(self):
+        parent_component = Mock()
+        parent_component.files_names.tests_dot.get.return_value = os.devnull
+        output = Output(parent_component)
+        r = self.relation_mock
+        relations = {(Mock(), Mock()): [r(), r(), r()]}
+        output.tests_dot(Output.relations_graph(relations))
+
+    def test_tests_dot_order(self):
+        r = self.relation_mock
+        relations = {('X', 'Y'): [r()], ('Z', 'X'): [r()], ('Y', 'Z'): [r()]}
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'links.txt')
+            parent_component = Mock()
+            parent_component.files_names.tests_dot.get.return_value = (
+                file_name)
+            output = Output(parent_component)
+            output.tests_dot(Output.relations_graph(relations))
+            with open(file_name, encoding='utf-8') as file:
+                lines = file.read().splitlines()
+        self.assertEqual(['"X" -- "Y"', '"Z" -- "X"', '"Y" -- "Z"'],
+                         [line.split(' [')[0] for line in lines[1:4]])
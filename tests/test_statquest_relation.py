@@ -16,6 +16,9 @@ Copyright (c) 2023 Sławomir Marczyński.
 from unittest import TestCase
 from unittest.mock import Mock
 
+import pandas as pd
+
+from statquest_observable import Observable
 from statquest_relation import Relation
 
 
@@ -70,6 +73,49 @@ class TestRelation(TestCase):
         result = Relation.create_relations([], [])
         self.assertEqual(expected, result)
 
+    def test_create_relations_4(self):
+        """symmetric test is carried out once for each pair"""
+        observables = [Observable(pd.Series([1, 2, 3], name=name))
+                       for name in 'xyz']
+        test = Mock()
+        test.is_symetric = True
+        test.batch.return_value = {}
+        test.can_be_carried_out.return_value = True
+        result = Relation.create_relations(observables, [test])
+        self.assertEqual(3, test.call_count)
+        self.assertEqual(3, len(result))
+
+    def test_create_relations_5(self):
+        """cached relations are not computed again"""
+        observables = [Observable(pd.Series([1, 2, 3], name=name))
+                       for name in 'xyz']
+        test = Mock()
+        test.is_symetric = True
+        test.batch.return_value = {}
+        test.can_be_carried_out.return_value = True
+        cache = {}
+        result1 = Relation.create_relations(observables, [test], cache=cache)
+        result2 = Relation.create_relations(observables, [test], cache=cache)
+        self.assertEqual(3, test.call_count)
+        self.assertEqual(3, len(cache))
+        self.assertEqual(result1, result2)
+
+    def test_create_relations_6(self):
+        """the batch is not computed when all relations are cached"""
+        observables = [Observable(pd.Series([1, 2, 3], name=name))
+                       for name in 'xyz']
+        test = Mock()
+        test.is_symetric = True
+        test.batch.return_value = {}
+        test.can_be_carried_out.return_value = True
+        cache = {}
+        Relation.create_relations(observables, [test], cache=cache)
+        Relation.create_relations(observables, [test], cache=cache)
+        self.assertEqual(1, test.batch.call_count)
+        del cache[(observables[0], observables[1], test)]
+        Relation.create_relations(observables, [test], cache=cache)
+        self.assertEqual(observables[:2], test.batch.call_args.args[0])
+
     def test_credible_only_1(self):
         relations = {}
         expected = {}
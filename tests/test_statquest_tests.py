@@ -110,3 +110,110 @@ class TestKendallTauTest(TestTest):
 # Dirty trick that makes the base class invisible for unittest auto discovery.
 #
 del TestTest
+
+
+class TestChiSquareContingency(TestCase):
+
+    def test_same_as_crosstab(self):
+        """Counting codes gives the same result as pandas.crosstab"""
+        a = pd.Series(
+            {i: 'xyz'[i % 3] for i in range(1, 60)}, name='a')
+        b = pd.Series(
+            {i: i % 4 + (i % 3 == 0) for i in range(20, 90)}, name='b')
+        relation = ChiSquareIndependenceTest()(Observable(a), Observable(b))
+        chisq, p_value, dof, expected = stats.chi2_contingency(
+            pd.crosstab(a, b))
+        self.assertAlmostEqual(chisq, relation.value)
+        self.assertAlmostEqual(p_value, relation.p_value)
+
+
+class TestPearsonCorrelationBatch(TestCase):
+
+    def test_same_as_pearsonr(self):
+        """Batch results are the same as results for each pair"""
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=50)
+        observables = [
+            Observable(pd.Series(x, name='x')),
+            Observable(pd.Series(x + rng.normal(size=50), name='y')),
+            Observable(pd.Series(rng.integers(0, 9, 50), name='z')),
+            Observable(pd.Series(rng.choice(['a', 'b'], 50), name='n'))]
+        test = PearsonCorrelationTest()
+        relations = test.batch(observables)
+        self.assertEqual(6, len(relations))
+        for (a, b), relation in relations.items():
+            expected = test(a, b)
+            self.assertAlmostEqual(expected.value, relation.value)
+            self.assertAlmostEqual(expected.p_value, relation.p_value)
+
+    def test_different_keys(self):
+        """Batch results for data with missing values (pairwise deletion)"""
+        rng = np.random.default_rng(2)
+        x = rng.normal(size=40)
+        y = x + rng.normal(size=40)
+        x[[3, 7, 11]] = np.nan
+        y[[5, 7, 30, 31]] = np.nan
+        observables = [
+            Observable(pd.Series(x, name='x')),
+            Observable(pd.Series(y, name='y')),
+            Observable(pd.Series({i: i % 5 for i in range(20, 60)}, name='z')),
+            Observable(pd.Series([1.0, 1.0, 1.0, 1.0], name='c'))]
+        test = PearsonCorrelationTest()
+        relations = test.batch(observables)
+        self.assertEqual(10, len(relations))  # no common keys for z, c
+        for (a, b), relation in relations.items():
+            expected = test(a, b)
+            if np.isnan(expected.value):
+                self.assertTrue(np.isnan(relation.value))
+            else:
+                self.assertAlmostEqual(expected.value, relation.value)
+                self.assertAlmostEqual(expected.p_value, relation.p_value)
+
+    def test_too_few_common_keys(self):
+        """Nothing is computed in batch for less than three common keys"""
+        observables = [
+            Observable(pd.Series([1.0, 2.0, 4.0, 3.0], name='x')),
+            Observable(pd.Series({2: 1.0, 3: 2.0, 4: 4.0}, name='y'))]
+        self.assertEqual({}, PearsonCorrelationTest().batch(observables))
+
+    def test_same_pairs_as_call(self):
+        """Batch and pair by pair tests give the same relations"""
+        rng = np.random.default_rng(3)
+        bools = list(rng.random(30) > 0.5)
+        data_frame = pd.DataFrame({
+            'f': rng.normal(size=30),
+            'i': rng.integers(0, 10, 30),
+            'b': bools,
+            'ob': pd.Series(bools[:29] + [np.nan], dtype=object),
+            'cb': pd.Series(bools[:28] + [np.nan, True]).astype('category'),
+            'ci': pd.Series(rng.integers(0, 3, 30)).astype('category'),
+            's': pd.Series(rng.choice(['a', 'b'], 30)).astype('category')})
+        data_frame.loc[[2, 9], 'f'] = np.nan
+        observables = [Observable(data_frame[name])
+                       for name in data_frame]
+        test = PearsonCorrelationTest()
+        expected = {}
+        for a in observables:
+            for b in observables:
+                if a is not b and test.can_be_carried_out(a, b):
+                    expected[(a, b)] = test(a, b)
+        relations = test.batch(observables)
+        self.assertEqual(set(expected), set(relations))
+        for key, relation in relations.items():
+            self.assertAlmostEqual(expected[key].value, relation.value)
+            self.assertAlmostEqual(expected[key].p_value, relation.p_value)
+
+
+class TestKruskalWallisGroups(TestCase):
+
+    def test_same_as_groupby(self):
+        """Grouping by codes gives the same result as pandas.groupby"""
+        a = pd.Series({i: 'xyz'[i % 3] for i in range(1, 60)}, name='a')
+        b = pd.Series({i: (i * 7919) % 101 / 3 for i in range(20, 90)},
+                      name='b')
+        relation = KruskalWallisTest()(Observable(a), Observable(b))
+        df = pd.concat([a, b], axis=1, join='inner')
+        groups = [g.to_numpy() for _, g in df.groupby('a')['b']]
+        h, p_value = stats.kruskal(*groups)
+        self.assertAlmostEqual(h, relation.value)
+        self.assertAlmostEqual(p_value, relation.p_value)